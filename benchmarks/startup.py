@@ -0,0 +1,104 @@
+"""
+Startup time benchmark.
+
+Runs each scenario in a fresh interpreter, the way the tool is launched in
+short-lived containers, and prints the best and median time of each one.
+
+Usage (from the repository root):
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 20 --first-request
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / 'src'
+
+# Each snippet prints the elapsed seconds of the measured part
+IMPORT_MAIN = """
+import time
+start = time.perf_counter()
+import main
+print(time.perf_counter() - start)
+"""
+
+IMPORT_SNAPSHOT_OPERATIONS = """
+import time
+start = time.perf_counter()
+import snapshot_operations
+print(time.perf_counter() - start)
+"""
+
+FIRST_REQUEST = """
+import time
+start = time.perf_counter()
+from snapshot_operations import SnapshotOperations
+SnapshotOperations().client.info()
+print(time.perf_counter() - start)
+"""
+
+
+def run_snippet(code: str) -> float:
+    """
+    Runs a snippet in a new interpreter.
+
+    Returns:
+        float: Seconds reported by the snippet.
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', code], cwd=SRC_DIR, capture_output=True, text=True, check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def run_command(args: list) -> float:
+    """
+    Runs main.py with the given arguments in a new interpreter.
+
+    Returns:
+        float: Wall clock seconds, interpreter startup included.
+    """
+    start = time.perf_counter()
+    subprocess.run([sys.executable, 'main.py', *args], cwd=SRC_DIR, capture_output=True)
+    return time.perf_counter() - start
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description='Startup time benchmark')
+    parser.add_argument('--runs', type=int, default=10, help='Runs per scenario (default: 10)')
+    parser.add_argument('--first-request', action='store_true',
+                        help='Also measure the first request latency (needs a reachable cluster in src/.env)')
+    parser.add_argument('--json', action='store_true', help='Print the results as JSON')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    scenarios = {
+        'import main': lambda: run_snippet(IMPORT_MAIN),
+        'import snapshot_operations': lambda: run_snippet(IMPORT_SNAPSHOT_OPERATIONS),
+        'main.py --help': lambda: run_command(['--help']),
+        'main.py --check-config': lambda: run_command(['--check-config']),
+    }
+    if args.first_request:
+        scenarios['first request'] = lambda: run_snippet(FIRST_REQUEST)
+
+    results = {}
+    for name, scenario in scenarios.items():
+        timings = [scenario() for _ in range(args.runs)]
+        results[name] = {'best_ms': round(min(timings) * 1000, 1), 'median_ms': round(statistics.median(timings) * 1000, 1)}
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+
+    for name, result in results.items():
+        print(f"{name:<28} best {result['best_ms']:>8} ms   median {result['median_ms']:>8} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,6 +3,7 @@ import os
 from dotenv import load_dotenv
 
 from logging_config import logger
+from retention import parse_retention_overrides
 
 load_dotenv()
 
@@ -18,6 +19,19 @@ class Config:
             self.delete_data_stream_after_snapshot = os.getenv('ELASTIC_DELETE_DATA_STREAM_AFTER_SNAPSHOT', 'false').lower() == 'true'
             self.delete_old_snapshots = os.getenv('ELASTIC_DELETE_OLD_SNAPSHOTS', 'false').lower() == 'true'
             self.min_days_to_delete_snapshot = os.getenv('ELASTIC_MIN_DAYS_TO_DELETE_SNAPSHOT')
+            self.retention_keep_weekly = os.getenv('ELASTIC_RETENTION_KEEP_WEEKLY', '0')
+            self.retention_keep_monthly = os.getenv('ELASTIC_RETENTION_KEEP_MONTHLY', '0')
+            self.retention_min_count = os.getenv('ELASTIC_RETENTION_MIN_COUNT', '0')
+            self.retention_overrides = os.getenv('ELASTIC_RETENTION_OVERRIDES', '')
+            self.repository_cleanup = os.getenv('ELASTIC_REPOSITORY_CLEANUP', 'false').lower() == 'true'
+            self.repository_cleanup_min_deleted = os.getenv('ELASTIC_REPOSITORY_CLEANUP_MIN_DELETED', '1')
+            self.repository_check = os.getenv('ELASTIC_REPOSITORY_CHECK', 'none').lower()
+            self.mount_searchable_snapshot = os.getenv('ELASTIC_MOUNT_SEARCHABLE_SNAPSHOT', 'false').lower() == 'true'
+            self.searchable_snapshot_storage = os.getenv('ELASTIC_SEARCHABLE_SNAPSHOT_STORAGE', 'shared_cache').lower()
+            self.max_concurrent_mounts = os.getenv('ELASTIC_MAX_CONCURRENT_MOUNTS', '2')
+            self.inventory_cache = os.getenv('ELASTIC_INVENTORY_CACHE', 'false').lower() == 'true'
+            self.inventory_cache_dir = os.getenv('ELASTIC_INVENTORY_CACHE_DIR', '.cache')
+            self.inventory_cache_max_age_hours = os.getenv('ELASTIC_INVENTORY_CACHE_MAX_AGE_HOURS', '168')
             self.max_workers = os.getenv('MAX_WORKERS', '4')
 
             self._validate()
@@ -54,6 +68,48 @@ class Config:
             except ValueError:
                 raise ValueError("ELASTIC_MIN_DAYS_TO_DELETE_SNAPSHOT must be an integer")
 
+            retention_vars = {
+                'ELASTIC_RETENTION_KEEP_WEEKLY': 'retention_keep_weekly',
+                'ELASTIC_RETENTION_KEEP_MONTHLY': 'retention_keep_monthly',
+                'ELASTIC_RETENTION_MIN_COUNT': 'retention_min_count'
+            }
+            for var, attribute in retention_vars.items():
+                try:
+                    setattr(self, attribute, int(getattr(self, attribute)))
+                except ValueError:
+                    raise ValueError(f"{var} must be an integer")
+
+            try:
+                self.retention_overrides = parse_retention_overrides(self.retention_overrides)
+            except ValueError as e:
+                raise ValueError(f"ELASTIC_RETENTION_OVERRIDES is invalid: {e}")
+
+        try:
+            self.repository_cleanup_min_deleted = int(self.repository_cleanup_min_deleted)
+        except ValueError:
+            raise ValueError("ELASTIC_REPOSITORY_CLEANUP_MIN_DELETED must be an integer")
+
+        if self.repository_check not in ('none', 'verify', 'analyze'):
+            raise ValueError("ELASTIC_REPOSITORY_CHECK must be 'none', 'verify' or 'analyze'")
+
+        if self.mount_searchable_snapshot and self.delete_data_stream_after_snapshot:
+            raise ValueError("ELASTIC_MOUNT_SEARCHABLE_SNAPSHOT and ELASTIC_DELETE_DATA_STREAM_AFTER_SNAPSHOT cannot both be enabled")
+
+        if self.searchable_snapshot_storage not in ('shared_cache', 'full_copy'):
+            raise ValueError("ELASTIC_SEARCHABLE_SNAPSHOT_STORAGE must be 'shared_cache' or 'full_copy'")
+
+        try:
+            self.max_concurrent_mounts = int(self.max_concurrent_mounts)
+        except ValueError:
+            raise ValueError("ELASTIC_MAX_CONCURRENT_MOUNTS must be an integer")
+        if self.max_concurrent_mounts < 1:
+            raise ValueError("ELASTIC_MAX_CONCURRENT_MOUNTS must be at least 1")
+
+        try:
+            self.inventory_cache_max_age_hours = int(self.inventory_cache_max_age_hours)
+        except ValueError:
+            raise ValueError("ELASTIC_INVENTORY_CACHE_MAX_AGE_HOURS must be an integer")
+
         try:
             self.max_workers = int(self.max_workers)
         except ValueError:
@@ -0,0 +1,156 @@
+import json
+import os
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+CACHE_FORMAT_VERSION = 1
+
+
+class SnapshotRecord:
+    __slots__ = ('name', 'start_time', 'state', 'indices')
+
+    def __init__(self, name: str, start_time: int, state: str, indices: Tuple[str, ...]):
+        self.name = name
+        self.start_time = start_time
+        self.state = state
+        self.indices = indices
+
+    @classmethod
+    def from_response(cls, snapshot: dict) -> 'SnapshotRecord':
+        """
+        Builds a record from a snapshot returned by the snapshot API.
+
+        Args:
+            snapshot (dict): Snapshot information as returned by Elasticsearch.
+
+        Returns:
+            SnapshotRecord: The compact record.
+        """
+        return cls(
+            snapshot['snapshot'],
+            snapshot.get('start_time_in_millis', 0),
+            snapshot.get('state', ''),
+            tuple(snapshot.get('indices', ()))
+        )
+
+
+class SnapshotInventory:
+    def __init__(self, path: str):
+        """
+        On-disk inventory of the snapshots of a repository.
+        It is valid for one repository generation; when the generation changes, deleted
+        snapshots are dropped and only the details of the snapshots started after the
+        high-water mark need to be fetched again.
+
+        Args:
+            path (str): Path of the cache file.
+        """
+        self.path = path
+        self.repository_uuid: Optional[str] = None
+        self.generation: Optional[int] = None
+        self.high_water_mark = 0
+        self.refreshed_at = 0.0
+        self.records: Dict[str, SnapshotRecord] = {}
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.records
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def names(self) -> List[str]:
+        return list(self.records)
+
+    def add(self, record: SnapshotRecord) -> None:
+        self.records[record.name] = record
+
+    def remove(self, name: str) -> None:
+        self.records.pop(name, None)
+
+    def replace(self, records: Iterable[SnapshotRecord]) -> None:
+        """
+        Replaces the whole inventory (full refresh).
+
+        Args:
+            records (Iterable[SnapshotRecord]): All snapshots of the repository.
+        """
+        self.records = {record.name: record for record in records}
+        self._update_high_water_mark()
+
+    def update(self, records: Iterable[SnapshotRecord]) -> None:
+        """
+        Merges the snapshots fetched since the high-water mark (incremental refresh).
+
+        Args:
+            records (Iterable[SnapshotRecord]): Snapshots started at or after the high-water mark.
+        """
+        for record in records:
+            self.records[record.name] = record
+        self._update_high_water_mark()
+
+    def retain(self, names: Set[str]) -> int:
+        """
+        Drops the snapshots that are no longer in the repository.
+
+        Args:
+            names (Set[str]): Names of the snapshots currently in the repository.
+
+        Returns:
+            int: Number of snapshots dropped.
+        """
+        count = len(self.records)
+        self.records = {name: record for name, record in self.records.items() if name in names}
+        self._update_high_water_mark()
+        return count - len(self.records)
+
+    def _update_high_water_mark(self) -> None:
+        # Snapshots still running may change, so the next refresh starts from the oldest of them
+        in_progress = [record.start_time for record in self.records.values() if record.state == 'IN_PROGRESS']
+        if in_progress:
+            self.high_water_mark = min(in_progress)
+        else:
+            self.high_water_mark = max((record.start_time for record in self.records.values()), default=0)
+
+    def load(self) -> bool:
+        """
+        Loads the inventory from disk.
+
+        Returns:
+            bool: True if a valid cache file was loaded, False otherwise.
+        """
+        try:
+            with open(self.path) as cache_file:
+                data = json.load(cache_file)
+            if data['version'] != CACHE_FORMAT_VERSION:
+                return False
+            self.repository_uuid = data['repository_uuid']
+            self.generation = data['generation']
+            self.high_water_mark = data['high_water_mark']
+            self.refreshed_at = data['refreshed_at']
+            self.records = {
+                name: SnapshotRecord(name, start_time, state, tuple(indices))
+                for name, start_time, state, indices in data['snapshots']
+            }
+            return True
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+
+    def save(self) -> None:
+        """
+        Writes the inventory to disk, replacing the cache file atomically.
+        """
+        data = {
+            'version': CACHE_FORMAT_VERSION,
+            'repository_uuid': self.repository_uuid,
+            'generation': self.generation,
+            'high_water_mark': self.high_water_mark,
+            'refreshed_at': self.refreshed_at,
+            'snapshots': [
+                [record.name, record.start_time, record.state, record.indices]
+                for record in self.records.values()
+            ]
+        }
+        os.makedirs(os.path.dirname(self.path) or '.', exist_ok=True)
+        temporary_path = f"{self.path}.tmp"
+        with open(temporary_path, 'w') as cache_file:
+            json.dump(data, cache_file, separators=(',', ':'))
+        os.replace(temporary_path, self.path)
@@ -2,10 +2,10 @@ import logging
 import os
 import sys
 
-from ecs_logging import StdlibFormatter
 from loguru import logger
 
 if os.getenv("SLOGGER_ENABLED", "").lower() == "true":
+    from ecs_logging import StdlibFormatter
     logger.remove()
     handler = logging.StreamHandler(sys.stdout)
     handler.setFormatter(StdlibFormatter())
@@ -1,18 +1,12 @@
 import argparse
 import concurrent.futures
-import warnings
+import sys
 from typing import List
 
-from elastic_transport import SecurityWarning
-from urllib3.exceptions import InsecureRequestWarning
-
 from logging_config import logger
-from snapshot_operations import SnapshotOperations
-
-warnings.simplefilter('ignore', SecurityWarning)
-warnings.simplefilter('ignore', InsecureRequestWarning)
 
-snapshot_ops = SnapshotOperations()
+# Built in main() so --help and --check-config do not import elasticsearch or open a client
+snapshot_ops = None
 
 def parse_args():
     """
@@ -23,11 +17,12 @@ def parse_args():
     """
     parser = argparse.ArgumentParser(description='Elasticsearch Snapshot Manager')
     parser.add_argument('--dry-run', action='store_true', help='Run in dry run mode (no changes will be made)')
+    parser.add_argument('--check-config', action='store_true', help='Validate the configuration and exit')
     return parser.parse_args()
 
 def process_data_stream(data_stream: str, dry_run: bool = False) -> None:
     """
-    Processes a single data stream (create snapshot and delete if necessary).
+    Processes a single data stream (create snapshot and mount or delete if necessary).
     
     Args:
         data_stream (str): Name of the data stream to process.
@@ -35,11 +30,18 @@ def process_data_stream(data_stream: str, dry_run: bool = False) -> None:
     """
     should_skip, reason = snapshot_ops.snapshot_exists(data_stream)
     if should_skip:
+        if snapshot_ops.config.mount_searchable_snapshot and snapshot_ops.can_resume_mount(data_stream):
+            # Indices already mounted from a successful snapshot mean a previous run did not finish
+            logger.info(f"Snapshot of {data_stream} already exists, resuming mount")
+            snapshot_ops.mount_searchable_snapshot(data_stream, dry_run)
+            return
         logger.warning(f"Skipping {data_stream} - {reason}")
         return
         
     if snapshot_ops.create_snapshot(data_stream, dry_run):
-        if snapshot_ops.config.delete_data_stream_after_snapshot:
+        if snapshot_ops.config.mount_searchable_snapshot:
+            snapshot_ops.mount_searchable_snapshot(data_stream, dry_run)
+        elif snapshot_ops.config.delete_data_stream_after_snapshot:
             snapshot_ops.delete_data_stream(data_stream, dry_run)
 
 def process_data_streams(data_streams: List[str], dry_run: bool = False) -> None:
@@ -70,10 +72,32 @@ def process_data_streams(data_streams: List[str], dry_run: bool = False) -> None
                 logger.error(f"Error processing data stream: {str(e)}")
                 continue
 
+def check_config() -> None:
+    """
+    Validates the configuration without connecting to Elasticsearch.
+    Exits with status 1 if the configuration is invalid; the error is
+    already logged by Config.
+    """
+    from config import Config
+    try:
+        Config()
+    except ValueError:
+        sys.exit(1)
+    logger.info("Configuration is valid")
+
 def main():
+    global snapshot_ops
     try:
-        logger.info("Starting elasticsearch snapshots")
         args = parse_args()
+        if args.check_config:
+            check_config()
+            return
+
+        logger.info("Starting elasticsearch snapshots")
+        if snapshot_ops is None:
+            from snapshot_operations import SnapshotOperations
+            snapshot_ops = SnapshotOperations()
+
         if args.dry_run:
             logger.info("Running in DRY RUN mode - no changes will be made")
         
@@ -82,6 +106,8 @@ def main():
         
         if snapshot_ops.config.delete_old_snapshots:
             snapshot_ops.delete_old_snapshots(dry_run=args.dry_run)
+
+        snapshot_ops.save_inventory()
         
         logger.info("Finishing elasticsearch snapshots")
         
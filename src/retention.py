@@ -0,0 +1,196 @@
+from datetime import datetime, timedelta
+from functools import lru_cache
+from fnmatch import fnmatchcase
+from typing import Dict, List, Optional, Tuple
+
+from logging_config import logger
+
+RETENTION_KEYS = ('daily', 'weekly', 'monthly', 'min_count')
+
+
+class RetentionPolicy:
+    def __init__(self, daily: int, weekly: int = 0, monthly: int = 0, min_count: int = 0):
+        """
+        Tiered retention policy for the snapshots of one data stream series.
+
+        Args:
+            daily (int): Keep every snapshot from the last `daily` days.
+            weekly (int): Keep the newest snapshot of each of the last `weekly` ISO weeks.
+            monthly (int): Keep the newest snapshot of each of the last `monthly` months.
+            min_count (int): Always keep at least the newest `min_count` snapshots.
+        """
+        self.daily = daily
+        self.weekly = weekly
+        self.monthly = monthly
+        self.min_count = min_count
+
+    def with_overrides(self, overrides: Dict[str, int]) -> 'RetentionPolicy':
+        """
+        Returns a copy of this policy with the given values replaced.
+
+        Args:
+            overrides (Dict[str, int]): Policy values to replace, keyed by RETENTION_KEYS.
+
+        Returns:
+            RetentionPolicy: The new policy.
+        """
+        values = {key: getattr(self, key) for key in RETENTION_KEYS}
+        values.update(overrides)
+        return RetentionPolicy(**values)
+
+
+class RetentionResult:
+    def __init__(self):
+        self.keep: List[str] = []
+        self.delete: List[str] = []
+        self.skipped: List[str] = []
+
+
+@lru_cache(maxsize=4096)
+def _parse_snapshot_date(date_str: str) -> datetime:
+    # Many series share the same dates, so strptime is only paid once per day
+    return datetime.strptime(date_str, '%Y.%m.%d')
+
+
+def _week_number(date: datetime) -> int:
+    # Number of the ISO week (starting on Monday), counted from the first week of year 1
+    return (date.toordinal() - date.weekday() - 1) // 7
+
+
+def parse_retention_overrides(value: Optional[str]) -> List[Tuple[str, Dict[str, int]]]:
+    """
+    Parses per-pattern retention overrides.
+    Format: "pattern:key=value,key=value;pattern:key=value" with keys from RETENTION_KEYS.
+
+    Args:
+        value (Optional[str]): Raw overrides string.
+
+    Returns:
+        List[Tuple[str, Dict[str, int]]]: (pattern, overrides) pairs, in the given order.
+
+    Raises:
+        ValueError: If the string is malformed.
+    """
+    overrides = []
+    if not value:
+        return overrides
+
+    for entry in value.split(';'):
+        entry = entry.strip()
+        if not entry:
+            continue
+        pattern, separator, settings = entry.partition(':')
+        if not separator or not pattern.strip():
+            raise ValueError(f"Invalid retention override: {entry}")
+
+        values = {}
+        for setting in settings.split(','):
+            key, separator, number = setting.partition('=')
+            key = key.strip()
+            if not separator or key not in RETENTION_KEYS:
+                raise ValueError(f"Invalid retention override setting: {setting.strip()}")
+            try:
+                values[key] = int(number)
+            except ValueError:
+                raise ValueError(f"Retention override {key} must be an integer")
+        overrides.append((pattern.strip(), values))
+
+    return overrides
+
+
+class RetentionEngine:
+    def __init__(self, default_policy: RetentionPolicy, overrides: Optional[List[Tuple[str, Dict[str, int]]]] = None):
+        """
+        Args:
+            default_policy (RetentionPolicy): Policy applied to series without a matching override.
+            overrides (Optional[List[Tuple[str, Dict[str, int]]]]): (pattern, overrides) pairs.
+                The first pattern matching the series name wins.
+        """
+        self.default_policy = default_policy
+        self.overrides = overrides or []
+
+    def policy_for(self, series: str) -> RetentionPolicy:
+        """
+        Resolves the policy for a data stream series.
+
+        Args:
+            series (str): Snapshot name without its date suffix.
+
+        Returns:
+            RetentionPolicy: The matching policy.
+        """
+        for pattern, overrides in self.overrides:
+            if fnmatchcase(series, pattern):
+                return self.default_policy.with_overrides(overrides)
+        return self.default_policy
+
+    def evaluate(self, snapshot_names: List[str], now: Optional[datetime] = None,
+                 states: Optional[Dict[str, str]] = None) -> RetentionResult:
+        """
+        Works out which snapshots to keep and which to delete.
+        Snapshots are grouped by series (the name without its "-YYYY.MM.DD" suffix)
+        and handled in a single pass over the inventory sorted by series and date,
+        newest first, so the whole evaluation is O(n log n).
+        Only successful snapshots count toward the minimum count and take the weekly
+        and monthly slots; the others are kept while in progress or inside the daily window.
+
+        Args:
+            snapshot_names (List[str]): Names of the snapshots in the repository.
+            now (Optional[datetime]): Reference time, defaults to the current time.
+            states (Optional[Dict[str, str]]): Snapshot state by name. Snapshots without
+                a state are considered successful.
+
+        Returns:
+            RetentionResult: Snapshots to keep, delete and skip (unparseable names).
+        """
+        now = now or datetime.now()
+        states = states or {}
+        current_week = _week_number(now)
+        current_month = now.year * 12 + now.month
+        result = RetentionResult()
+
+        inventory = []
+        for name in snapshot_names:
+            series, _, date_str = name.rpartition('-')
+            try:
+                snapshot_date = _parse_snapshot_date(date_str)
+            except ValueError:
+                logger.warning(f"Could not parse date from snapshot name: {name}")
+                result.skipped.append(name)
+                continue
+            inventory.append((series, snapshot_date, name))
+
+        inventory.sort(key=lambda item: (item[0], -item[1].toordinal()))
+
+        current_series = None
+        for series, snapshot_date, name in inventory:
+            if series != current_series:
+                current_series = series
+                policy = self.policy_for(series)
+                daily_cutoff = now - timedelta(days=policy.daily)
+                position = 0
+                seen_weeks = set()
+                seen_months = set()
+
+            state = states.get(name, 'SUCCESS')
+            if state != 'SUCCESS':
+                keep = state == 'IN_PROGRESS' or snapshot_date >= daily_cutoff
+            else:
+                position += 1
+                week = _week_number(snapshot_date)
+                month = snapshot_date.year * 12 + snapshot_date.month
+
+                keep = position <= policy.min_count or snapshot_date >= daily_cutoff
+                if current_week - week < policy.weekly and week not in seen_weeks:
+                    seen_weeks.add(week)
+                    keep = True
+                if current_month - month < policy.monthly and month not in seen_months:
+                    seen_months.add(month)
+                    keep = True
+
+            if keep:
+                result.keep.append(name)
+            else:
+                result.delete.append(name)
+
+        return result
@@ -1,10 +1,37 @@
+import hashlib
+import os
+import threading
+import time
+import warnings
 from datetime import datetime, timedelta
 from typing import List
 
+from elastic_transport import SecurityWarning
 from elasticsearch import Elasticsearch, NotFoundError
+from urllib3.exceptions import InsecureRequestWarning
 
 from config import Config
+from inventory_cache import SnapshotInventory, SnapshotRecord
 from logging_config import logger
+from retention import RetentionEngine, RetentionPolicy
+
+warnings.simplefilter('ignore', SecurityWarning)
+warnings.simplefilter('ignore', InsecureRequestWarning)
+
+# Same naming ILM uses for partially (frozen) and fully (cold) mounted indices
+MOUNTED_INDEX_PREFIXES = {
+    'shared_cache': 'partial-',
+    'full_copy': 'restored-'
+}
+MOUNT_WAIT_TIMEOUT_SECONDS = 1800
+# The health call blocks server side, so the client must wait longer than it
+MOUNT_REQUEST_TIMEOUT_SECONDS = MOUNT_WAIT_TIMEOUT_SECONDS + 60
+# Small analysis so the maintenance stage does not load the repository
+REPOSITORY_ANALYSIS_BLOB_COUNT = 10
+REPOSITORY_ANALYSIS_MAX_BLOB_SIZE = '10mb'
+REPOSITORY_ANALYSIS_TIMEOUT_SECONDS = 600
+# Cleanup and analysis can take long on large repositories, past the client's default timeout
+REPOSITORY_MAINTENANCE_REQUEST_TIMEOUT_SECONDS = 3600
 
 
 class SnapshotError(Exception):
@@ -20,6 +47,9 @@ class SnapshotOperations:
             basic_auth=(self.config.elasticsearch_username, self.config.elasticsearch_password),
             verify_certs=False
         )
+        self.mount_semaphore = threading.BoundedSemaphore(self.config.max_concurrent_mounts)
+        self.inventory = None
+        self.inventory_lock = threading.Lock()
 
     def get_data_streams_older_than_days(self) -> List[str]:
         """
@@ -52,6 +82,120 @@ class SnapshotOperations:
         except Exception as e:
             raise SnapshotError(f"Error getting data streams: {str(e)}")
 
+    def _get_repository_generation(self) -> tuple[str, int]:
+        """
+        Gets the uuid and current generation of the snapshot repository.
+        
+        Returns:
+            tuple[str, int]: (uuid, generation) of the repository.
+        """
+        state = self.client.cluster.state(metric='metadata', filter_path='metadata.repositories')
+        repository = state['metadata']['repositories'][self.config.repository_name]
+        return repository.get('uuid'), repository['generation']
+
+    def _load_inventory(self) -> SnapshotInventory:
+        """
+        Loads the snapshot inventory from the cache and brings it up to date.
+        Nothing is fetched if the repository generation did not change. If it did, the
+        snapshot names are listed to drop deleted snapshots and only the details of the
+        snapshots started since the high-water mark are fetched; if the names still do
+        not match, the whole inventory is fetched. It is also fully fetched if there is
+        no cache, the repository was re-created or the cache is older than
+        ELASTIC_INVENTORY_CACHE_MAX_AGE_HOURS.
+        
+        Returns:
+            SnapshotInventory: The up to date inventory.
+        """
+        pattern_hash = hashlib.sha1(self.config.data_stream_pattern.encode()).hexdigest()[:12]
+        inventory = SnapshotInventory(os.path.join(
+            self.config.inventory_cache_dir,
+            f"{self.config.repository_name}-{pattern_hash}.json"
+        ))
+        loaded = inventory.load()
+        uuid, generation = self._get_repository_generation()
+        max_age = self.config.inventory_cache_max_age_hours * 3600
+
+        if not loaded or inventory.repository_uuid != uuid or time.time() - inventory.refreshed_at > max_age:
+            self._refresh_full_inventory(inventory)
+        elif inventory.generation != generation:
+            names = self.client.snapshot.get(
+                repository=self.config.repository_name,
+                snapshot=self.config.data_stream_pattern,
+                verbose=False
+            )
+            current_names = {snapshot['snapshot'] for snapshot in names['snapshots']}
+            snapshots = self.client.snapshot.get(
+                repository=self.config.repository_name,
+                snapshot=self.config.data_stream_pattern,
+                sort='start_time',
+                from_sort_value=str(inventory.high_water_mark)
+            )
+            inventory.update(SnapshotRecord.from_response(snapshot) for snapshot in snapshots['snapshots'])
+            removed = inventory.retain(current_names)
+
+            if len(inventory) != len(current_names):
+                logger.info("Snapshot inventory cache is missing snapshots, refreshing it fully")
+                self._refresh_full_inventory(inventory)
+            else:
+                logger.info(
+                    f"Snapshot inventory refreshed with {len(snapshots['snapshots'])} recent snapshots, "
+                    f"{removed} deleted snapshots removed"
+                )
+        else:
+            logger.info(f"Snapshot inventory cache is up to date (generation {generation})")
+
+        inventory.repository_uuid = uuid
+        inventory.generation = generation
+        return inventory
+
+    def _refresh_full_inventory(self, inventory: SnapshotInventory) -> None:
+        """
+        Replaces the inventory with all the snapshots matching the data stream pattern.
+        
+        Args:
+            inventory (SnapshotInventory): The inventory to refresh.
+        """
+        snapshots = self.client.snapshot.get(
+            repository=self.config.repository_name,
+            snapshot=self.config.data_stream_pattern
+        )
+        inventory.replace(SnapshotRecord.from_response(snapshot) for snapshot in snapshots['snapshots'])
+        inventory.refreshed_at = time.time()
+        logger.info(f"Snapshot inventory fully refreshed: {len(inventory)} snapshots")
+
+    def get_inventory(self) -> SnapshotInventory:
+        """
+        Gets the snapshot inventory, loading it on first use.
+        
+        Returns:
+            SnapshotInventory: The snapshot inventory.
+        """
+        with self.inventory_lock:
+            if self.inventory is None:
+                self.inventory = self._load_inventory()
+            return self.inventory
+
+    def save_inventory(self) -> bool:
+        """
+        Saves the snapshot inventory to the cache, if it was loaded.
+        It keeps the generation and high-water mark of the last refresh, so snapshots
+        created or deleted by this run are picked up by the next incremental refresh.
+        
+        Returns:
+            bool: True if the inventory was saved or there was nothing to save, False otherwise.
+        """
+        if self.inventory is None:
+            return True
+
+        try:
+            with self.inventory_lock:
+                self.inventory.save()
+            logger.info(f"Saved snapshot inventory cache: {self.inventory.path}")
+            return True
+        except Exception as e:
+            logger.error(f"Error saving snapshot inventory cache: {str(e)}")
+            return False
+
     def snapshot_exists(self, data_stream_name: str) -> tuple[bool, str]:
         """
         Checks if a snapshot with the same name as the data stream already exists.
@@ -64,6 +208,11 @@ class SnapshotOperations:
             tuple[bool, str]: (True, reason) if should skip, (False, "") if should process
         """
         try:
+            if self.config.inventory_cache:
+                if data_stream_name in self.get_inventory():
+                    return True, "snapshot already exists"
+                return False, ""
+
             self.client.snapshot.get(
                 repository=self.config.repository_name,
                 snapshot=data_stream_name
@@ -90,7 +239,7 @@ class SnapshotOperations:
             return True
             
         try:
-            self.client.snapshot.create(
+            response = self.client.snapshot.create(
                 repository=self.config.repository_name,
                 snapshot=data_stream_name,
                 indices=data_stream_name,
@@ -101,6 +250,9 @@ class SnapshotOperations:
             )
 
             logger.info(f"Created snapshot: {data_stream_name}")
+            if self.inventory is not None:
+                with self.inventory_lock:
+                    self.inventory.add(SnapshotRecord.from_response(response['snapshot']))
             return True
         except Exception as e:
             logger.error(f"Error creating snapshot for {data_stream_name}: {str(e)}")
@@ -129,10 +281,163 @@ class SnapshotOperations:
             logger.error(f"Error deleting data stream {data_stream_name}: {str(e)}")
             return False
 
+    def _get_mount_targets(self, data_stream_name: str) -> tuple[List[str], List[str], set[str]]:
+        """
+        Gets the backing indices of a data stream, the names they are mounted under
+        and which of those mounted indices already exist.
+        
+        Args:
+            data_stream_name (str): Name of the data stream.
+            
+        Returns:
+            tuple[List[str], List[str], set[str]]: (backing indices, mounted index names, already mounted indices)
+        """
+        data_streams = self.client.indices.get_data_stream(name=data_stream_name)
+        backing_indices = [index['index_name'] for index in data_streams['data_streams'][0]['indices']]
+        prefix = MOUNTED_INDEX_PREFIXES[self.config.searchable_snapshot_storage]
+        mounted_indices = [f"{prefix}{index}" for index in backing_indices]
+        already_mounted = set(self.client.indices.get_settings(
+            index=mounted_indices,
+            name='index.store.snapshot.snapshot_name',
+            ignore_unavailable=True,
+            allow_no_indices=True
+        ))
+        return backing_indices, mounted_indices, already_mounted
+
+    def can_resume_mount(self, data_stream_name: str) -> bool:
+        """
+        Checks if the mount of a data stream whose snapshot already exists was started
+        by a previous run and can be finished. The snapshot must be successful and at
+        least one of the backing indices must already be mounted, so an older snapshot
+        that does not cover the data stream is never used to delete it.
+        
+        Args:
+            data_stream_name (str): Name of the data stream (and of its snapshot).
+            
+        Returns:
+            bool: True if the mount can be resumed, False otherwise.
+        """
+        try:
+            snapshots = self.client.snapshot.get(
+                repository=self.config.repository_name,
+                snapshot=data_stream_name
+            )
+            if snapshots['snapshots'][0]['state'] != 'SUCCESS':
+                return False
+            _, _, already_mounted = self._get_mount_targets(data_stream_name)
+            return bool(already_mounted)
+        except Exception as e:
+            logger.error(f"Error checking if the mount of {data_stream_name} can be resumed: {str(e)}")
+            return False
+
+    def mount_searchable_snapshot(self, data_stream_name: str, dry_run: bool = False) -> bool:
+        """
+        Mounts the backing indices of a snapshotted data stream as searchable snapshots
+        and then removes the hot copies by deleting the data stream. An alias with the
+        data stream name is added to the mounted indices so existing queries keep working.
+        
+        All backing indices are mounted without waiting and then awaited together with a
+        single cluster health call. The number of data streams being mounted at the same
+        time is limited by ELASTIC_MAX_CONCURRENT_MOUNTS. Indices mounted by a previous,
+        unfinished run are not mounted again, so the operation can be resumed. The data
+        stream is only deleted if the mounted indices hold as many documents as it does.
+        
+        Args:
+            data_stream_name (str): Name of the data stream (and of its snapshot).
+            dry_run (bool): If True, only simulates the operation without making changes.
+            
+        Returns:
+            bool: True if the indices were mounted and the data stream deleted, False otherwise.
+        """
+        storage = self.config.searchable_snapshot_storage
+        if dry_run:
+            logger.info(f"[DRY RUN] Would mount {data_stream_name} as searchable snapshot ({storage}) and delete the data stream")
+            return True
+
+        try:
+            backing_indices, mounted_indices, already_mounted = self._get_mount_targets(data_stream_name)
+
+            with self.mount_semaphore:
+                for index, mounted_index in zip(backing_indices, mounted_indices):
+                    if mounted_index in already_mounted:
+                        continue
+                    self.client.searchable_snapshots.mount(
+                        repository=self.config.repository_name,
+                        snapshot=data_stream_name,
+                        index=index,
+                        renamed_index=mounted_index,
+                        storage=storage,
+                        wait_for_completion=False
+                    )
+
+                # Elasticsearch answers 408 when the wait times out, keep the body to report it
+                health = self.client.options(
+                    request_timeout=MOUNT_REQUEST_TIMEOUT_SECONDS,
+                    ignore_status=408
+                ).cluster.health(
+                    index=mounted_indices,
+                    wait_for_status='green',
+                    timeout=f"{MOUNT_WAIT_TIMEOUT_SECONDS}s"
+                )
+                if health['timed_out']:
+                    logger.error(f"Timed out waiting for mounted indices of {data_stream_name}, keeping the data stream")
+                    return False
+
+            logger.info(f"Mounted {len(mounted_indices)} indices of {data_stream_name} as searchable snapshot ({storage})")
+
+            data_stream_docs = self.client.count(index=backing_indices)['count']
+            mounted_docs = self.client.count(index=mounted_indices)['count']
+            if data_stream_docs != mounted_docs:
+                logger.error(
+                    f"Mounted indices of {data_stream_name} have {mounted_docs} documents but the data stream "
+                    f"has {data_stream_docs}, keeping the data stream"
+                )
+                return False
+        except Exception as e:
+            logger.error(f"Error mounting searchable snapshot for {data_stream_name}: {str(e)}")
+            return False
+
+        if not self.delete_data_stream(data_stream_name):
+            return False
+
+        try:
+            self.client.indices.update_aliases(
+                actions=[{'add': {'indices': mounted_indices, 'alias': data_stream_name}}]
+            )
+            logger.info(f"Added alias {data_stream_name} to mounted indices")
+            return True
+        except Exception as e:
+            logger.error(f"Error adding alias {data_stream_name} to mounted indices: {str(e)}")
+            return False
+
+    def _get_mounted_snapshots(self) -> set[str]:
+        """
+        Gets the snapshots of the repository that back mounted searchable snapshot indices.
+        Elasticsearch refuses to delete them while the indices exist.
+        
+        Returns:
+            set[str]: Names of the snapshots in use.
+        """
+        settings = self.client.indices.get_settings(
+            index='*',
+            name=['index.store.snapshot.repository_name', 'index.store.snapshot.snapshot_name'],
+            expand_wildcards='all',
+            flat_settings=True
+        )
+        mounted_snapshots = set()
+        for index in settings:
+            index_settings = settings[index]['settings']
+            if index_settings.get('index.store.snapshot.repository_name') == self.config.repository_name:
+                mounted_snapshots.add(index_settings['index.store.snapshot.snapshot_name'])
+        return mounted_snapshots
+
     def delete_old_snapshots(self, dry_run: bool = False) -> bool:
         """
-        Deletes snapshots older than the configured minimum days.
+        Deletes the snapshots selected by the retention policy.
         Only considers snapshots that match the configured data stream pattern.
+        Snapshots newer than the configured minimum days are always kept, and the
+        weekly, monthly, minimum count and per-pattern rules can keep older ones.
+        Snapshots backing mounted searchable snapshot indices are never deleted.
         
         Args:
             dry_run (bool): If True, only simulates the operation without making changes.
@@ -141,33 +446,65 @@ class SnapshotOperations:
             bool: True if the operation was successful, False otherwise.
         """
         try:
-            snapshots = self.client.snapshot.get(
-                repository=self.config.repository_name,
-                snapshot=self.config.data_stream_pattern
-            )
+            if self.config.inventory_cache:
+                records = self.get_inventory().records.values()
+                snapshot_states = {record.name: record.state for record in records}
+            else:
+                snapshots = self.client.snapshot.get(
+                    repository=self.config.repository_name,
+                    snapshot=self.config.data_stream_pattern,
+                    verbose=False
+                )
+                snapshot_states = {snapshot['snapshot']: snapshot['state'] for snapshot in snapshots['snapshots']}
             
-            cutoff_date = datetime.now() - timedelta(days=self.config.min_days_to_delete_snapshot)
+            engine = RetentionEngine(
+                RetentionPolicy(
+                    daily=self.config.min_days_to_delete_snapshot,
+                    weekly=self.config.retention_keep_weekly,
+                    monthly=self.config.retention_keep_monthly,
+                    min_count=self.config.retention_min_count
+                ),
+                self.config.retention_overrides
+            )
+            retention = engine.evaluate(list(snapshot_states), states=snapshot_states)
             deleted_count = 0
+            kept_count = len(retention.keep)
+            reclaimed_by_series = {}
+
+            try:
+                mounted_snapshots = self._get_mounted_snapshots()
+            except Exception as e:
+                logger.warning(f"Could not get snapshots backing mounted indices: {str(e)}")
+                mounted_snapshots = set()
             
-            for snapshot in snapshots['snapshots']:
+            for snapshot_name in retention.delete:
+                if snapshot_name in mounted_snapshots:
+                    logger.info(f"Keeping old snapshot {snapshot_name} - it backs mounted searchable snapshot indices")
+                    kept_count += 1
+                    continue
+
+                series = snapshot_name.rpartition('-')[0]
+                if dry_run:
+                    logger.info(f"[DRY RUN] Would delete old snapshot: {snapshot_name}")
+                    deleted_count += 1
+                    reclaimed_by_series[series] = reclaimed_by_series.get(series, 0) + 1
+                    continue
+
                 try:
-                    date_str = snapshot['snapshot'].split('-')[-1]
-                    snapshot_date = datetime.strptime(date_str, '%Y.%m.%d')
-                    
-                    if snapshot_date < cutoff_date:
-                        if dry_run:
-                            logger.info(f"[DRY RUN] Would delete old snapshot: {snapshot['snapshot']}")
-                            deleted_count += 1
-                        else:
-                            self.client.snapshot.delete(
-                                repository=self.config.repository_name,
-                                snapshot=snapshot['snapshot']
-                            )
-                            logger.info(f"Deleted old snapshot: {snapshot['snapshot']}")
-                            deleted_count += 1
-                except (ValueError, IndexError):
-                    logger.warning(f"Could not parse date from snapshot name: {snapshot['snapshot']}")
+                    self.client.snapshot.delete(
+                        repository=self.config.repository_name,
+                        snapshot=snapshot_name
+                    )
+                    logger.info(f"Deleted old snapshot: {snapshot_name}")
+                    deleted_count += 1
+                    reclaimed_by_series[series] = reclaimed_by_series.get(series, 0) + 1
+                except NotFoundError:
+                    logger.warning(f"Snapshot already deleted: {snapshot_name}")
+                except Exception as e:
+                    logger.error(f"Error deleting old snapshot {snapshot_name}: {str(e)}")
                     continue
+                if self.inventory is not None:
+                    self.inventory.remove(snapshot_name)
             
             if deleted_count == 0:
                 logger.info("No old snapshots to delete")
@@ -175,8 +512,72 @@ class SnapshotOperations:
                 logger.info(f"[DRY RUN] Would delete {deleted_count} old snapshots")
             else:
                 logger.info(f"Successfully deleted {deleted_count} old snapshots")
+
+            report = "[DRY RUN] Retention report" if dry_run else "Retention report"
+            for series, count in sorted(reclaimed_by_series.items()):
+                logger.info(f"{report}: {series} - {count} reclaimed")
+            logger.info(
+                f"{report}: {kept_count} kept, {deleted_count} reclaimed, "
+                f"{len(retention.skipped)} skipped"
+            )
+
+            if self.config.repository_cleanup and deleted_count >= self.config.repository_cleanup_min_deleted:
+                self.maintain_repository(dry_run)
             
             return True
         except Exception as e:
             logger.error(f"Error deleting old snapshots: {str(e)}")
             return False
+
+    def maintain_repository(self, dry_run: bool = False) -> bool:
+        """
+        Cleans up unreferenced data in the snapshot repository and optionally verifies
+        or analyzes it. Bytes and blobs reclaimed and the time taken are logged as metrics.
+        
+        Args:
+            dry_run (bool): If True, only simulates the operation without making changes.
+            
+        Returns:
+            bool: True if the maintenance was successful, False otherwise.
+        """
+        repository = self.config.repository_name
+        if dry_run:
+            logger.info(f"[DRY RUN] Would clean up repository {repository}")
+            return True
+
+        client = self.client.options(request_timeout=REPOSITORY_MAINTENANCE_REQUEST_TIMEOUT_SECONDS)
+        try:
+            start = time.monotonic()
+            response = client.snapshot.cleanup_repository(name=repository)
+            metrics = {
+                'deleted_bytes': response['results']['deleted_bytes'],
+                'deleted_blobs': response['results']['deleted_blobs'],
+                'cleanup_seconds': round(time.monotonic() - start, 3)
+            }
+            logger.bind(**metrics).info(
+                f"Cleaned up repository {repository}: {metrics['deleted_bytes']} bytes and "
+                f"{metrics['deleted_blobs']} blobs reclaimed in {metrics['cleanup_seconds']}s"
+            )
+
+            check = self.config.repository_check
+            if check == 'none':
+                return True
+
+            start = time.monotonic()
+            if check == 'verify':
+                client.snapshot.verify_repository(name=repository)
+            else:
+                client.snapshot.repository_analyze(
+                    name=repository,
+                    blob_count=REPOSITORY_ANALYSIS_BLOB_COUNT,
+                    max_blob_size=REPOSITORY_ANALYSIS_MAX_BLOB_SIZE,
+                    timeout=f"{REPOSITORY_ANALYSIS_TIMEOUT_SECONDS}s"
+                )
+            check_seconds = round(time.monotonic() - start, 3)
+            logger.bind(**{f"{check}_seconds": check_seconds}).info(
+                f"Repository {repository} {check} succeeded in {check_seconds}s"
+            )
+            return True
+        except Exception as e:
+            logger.error(f"Error maintaining repository {repository}: {str(e)}")
+            return False
@@ -34,7 +34,14 @@ def clear_env(monkeypatch):
         'ELASTIC_TARGET', 'ELASTIC_USER', 'ELASTIC_PASS',
         'ELASTIC_REPOSITORY_NAME', 'ELASTIC_DATA_STREAM_PATTERN',
         'ELASTIC_MIN_DAYS_TO_SNAPSHOT', 'ELASTIC_MIN_DAYS_TO_DELETE_SNAPSHOT',
-        'ELASTIC_DELETE_OLD_SNAPSHOTS', 'MAX_WORKERS'
+        'ELASTIC_DELETE_OLD_SNAPSHOTS', 'MAX_WORKERS',
+        'ELASTIC_DELETE_DATA_STREAM_AFTER_SNAPSHOT', 'ELASTIC_MOUNT_SEARCHABLE_SNAPSHOT',
+        'ELASTIC_SEARCHABLE_SNAPSHOT_STORAGE', 'ELASTIC_MAX_CONCURRENT_MOUNTS',
+        'ELASTIC_RETENTION_KEEP_WEEKLY', 'ELASTIC_RETENTION_KEEP_MONTHLY',
+        'ELASTIC_RETENTION_MIN_COUNT', 'ELASTIC_RETENTION_OVERRIDES',
+        'ELASTIC_REPOSITORY_CLEANUP', 'ELASTIC_REPOSITORY_CLEANUP_MIN_DELETED',
+        'ELASTIC_REPOSITORY_CHECK', 'ELASTIC_INVENTORY_CACHE',
+        'ELASTIC_INVENTORY_CACHE_DIR', 'ELASTIC_INVENTORY_CACHE_MAX_AGE_HOURS'
     ]
     for key in keys:
         monkeypatch.delenv(key, raising=False)
@@ -122,3 +129,146 @@ def test_config_delete_old_snapshots_non_bool(monkeypatch):
     monkeypatch.setenv('ELASTIC_DELETE_OLD_SNAPSHOTS', 'not_bool')
     config = Config()
     assert config.delete_old_snapshots is False
+
+
+def set_required_env(monkeypatch):
+    monkeypatch.setenv('ELASTIC_TARGET', 'http://localhost:9200')
+    monkeypatch.setenv('ELASTIC_USER', 'user')
+    monkeypatch.setenv('ELASTIC_PASS', 'pass')
+    monkeypatch.setenv('ELASTIC_REPOSITORY_NAME', 'repo')
+    monkeypatch.setenv('ELASTIC_DATA_STREAM_PATTERN', 'pattern')
+    monkeypatch.setenv('ELASTIC_MIN_DAYS_TO_SNAPSHOT', '7')
+
+def test_config_mount_searchable_snapshot(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_MOUNT_SEARCHABLE_SNAPSHOT', 'true')
+    monkeypatch.setenv('ELASTIC_SEARCHABLE_SNAPSHOT_STORAGE', 'FULL_COPY')
+    monkeypatch.setenv('ELASTIC_MAX_CONCURRENT_MOUNTS', '3')
+    config = Config()
+    assert config.mount_searchable_snapshot is True
+    assert config.searchable_snapshot_storage == 'full_copy'
+    assert config.max_concurrent_mounts == 3
+
+def test_config_mount_searchable_snapshot_defaults(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    config = Config()
+    assert config.mount_searchable_snapshot is False
+    assert config.searchable_snapshot_storage == 'shared_cache'
+    assert config.max_concurrent_mounts == 2
+
+def test_config_mount_and_delete_data_stream(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_MOUNT_SEARCHABLE_SNAPSHOT', 'true')
+    monkeypatch.setenv('ELASTIC_DELETE_DATA_STREAM_AFTER_SNAPSHOT', 'true')
+    with pytest.raises(ValueError) as exc_info:
+        Config()
+    assert "cannot both be enabled" in str(exc_info.value)
+
+def test_config_invalid_searchable_snapshot_storage(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_SEARCHABLE_SNAPSHOT_STORAGE', 'invalid')
+    with pytest.raises(ValueError) as exc_info:
+        Config()
+    assert "ELASTIC_SEARCHABLE_SNAPSHOT_STORAGE must be" in str(exc_info.value)
+
+def test_config_invalid_max_concurrent_mounts(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_MAX_CONCURRENT_MOUNTS', 'invalid')
+    with pytest.raises(ValueError) as exc_info:
+        Config()
+    assert "ELASTIC_MAX_CONCURRENT_MOUNTS must be an integer" in str(exc_info.value)
+
+@pytest.mark.parametrize('value', ['0', '-1'])
+def test_config_max_concurrent_mounts_below_one(monkeypatch, value):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_MAX_CONCURRENT_MOUNTS', value)
+    with pytest.raises(ValueError) as exc_info:
+        Config()
+    assert "ELASTIC_MAX_CONCURRENT_MOUNTS must be at least 1" in str(exc_info.value)
+
+def test_config_retention_policy(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_DELETE_OLD_SNAPSHOTS', 'true')
+    monkeypatch.setenv('ELASTIC_MIN_DAYS_TO_DELETE_SNAPSHOT', '30')
+    monkeypatch.setenv('ELASTIC_RETENTION_KEEP_WEEKLY', '8')
+    monkeypatch.setenv('ELASTIC_RETENTION_KEEP_MONTHLY', '12')
+    monkeypatch.setenv('ELASTIC_RETENTION_MIN_COUNT', '3')
+    monkeypatch.setenv('ELASTIC_RETENTION_OVERRIDES', 'logs-audit-*:monthly=24,min_count=10')
+    config = Config()
+    assert config.retention_keep_weekly == 8
+    assert config.retention_keep_monthly == 12
+    assert config.retention_min_count == 3
+    assert config.retention_overrides == [('logs-audit-*', {'monthly': 24, 'min_count': 10})]
+
+def test_config_invalid_retention_keep_weekly(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_DELETE_OLD_SNAPSHOTS', 'true')
+    monkeypatch.setenv('ELASTIC_MIN_DAYS_TO_DELETE_SNAPSHOT', '30')
+    monkeypatch.setenv('ELASTIC_RETENTION_KEEP_WEEKLY', 'invalid')
+    with pytest.raises(ValueError) as exc_info:
+        Config()
+    assert "ELASTIC_RETENTION_KEEP_WEEKLY must be an integer" in str(exc_info.value)
+
+def test_config_invalid_retention_overrides(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_DELETE_OLD_SNAPSHOTS', 'true')
+    monkeypatch.setenv('ELASTIC_MIN_DAYS_TO_DELETE_SNAPSHOT', '30')
+    monkeypatch.setenv('ELASTIC_RETENTION_OVERRIDES', 'logs-*:yearly=1')
+    with pytest.raises(ValueError) as exc_info:
+        Config()
+    assert "ELASTIC_RETENTION_OVERRIDES is invalid" in str(exc_info.value)
+
+def test_config_repository_cleanup(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_REPOSITORY_CLEANUP', 'true')
+    monkeypatch.setenv('ELASTIC_REPOSITORY_CLEANUP_MIN_DELETED', '50')
+    monkeypatch.setenv('ELASTIC_REPOSITORY_CHECK', 'Verify')
+    config = Config()
+    assert config.repository_cleanup is True
+    assert config.repository_cleanup_min_deleted == 50
+    assert config.repository_check == 'verify'
+
+def test_config_invalid_repository_cleanup_min_deleted(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_REPOSITORY_CLEANUP_MIN_DELETED', 'invalid')
+    with pytest.raises(ValueError) as exc_info:
+        Config()
+    assert "ELASTIC_REPOSITORY_CLEANUP_MIN_DELETED must be an integer" in str(exc_info.value)
+
+def test_config_invalid_repository_check(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_REPOSITORY_CHECK', 'invalid')
+    with pytest.raises(ValueError) as exc_info:
+        Config()
+    assert "ELASTIC_REPOSITORY_CHECK must be" in str(exc_info.value)
+
+def test_config_inventory_cache(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_INVENTORY_CACHE', 'true')
+    monkeypatch.setenv('ELASTIC_INVENTORY_CACHE_DIR', '/var/cache/snapshots')
+    monkeypatch.setenv('ELASTIC_INVENTORY_CACHE_MAX_AGE_HOURS', '24')
+    config = Config()
+    assert config.inventory_cache is True
+    assert config.inventory_cache_dir == '/var/cache/snapshots'
+    assert config.inventory_cache_max_age_hours == 24
+
+def test_config_invalid_inventory_cache_max_age_hours(monkeypatch):
+    clear_env(monkeypatch)
+    set_required_env(monkeypatch)
+    monkeypatch.setenv('ELASTIC_INVENTORY_CACHE_MAX_AGE_HOURS', 'invalid')
+    with pytest.raises(ValueError) as exc_info:
+        Config()
+    assert "ELASTIC_INVENTORY_CACHE_MAX_AGE_HOURS must be an integer" in str(exc_info.value)
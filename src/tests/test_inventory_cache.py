@@ -0,0 +1,89 @@
+import json
+
+from inventory_cache import SnapshotInventory, SnapshotRecord
+
+
+def record(name, start_time, state='SUCCESS'):
+    return SnapshotRecord(name, start_time, state, (f".ds-{name}-000001",))
+
+def test_record_from_response():
+    snapshot = SnapshotRecord.from_response({
+        'snapshot': 'logs-app-2024.01.01',
+        'start_time_in_millis': 1000,
+        'state': 'SUCCESS',
+        'indices': ['.ds-logs-app-2024.01.01-000001']
+    })
+    assert snapshot.name == 'logs-app-2024.01.01'
+    assert snapshot.start_time == 1000
+    assert snapshot.state == 'SUCCESS'
+    assert snapshot.indices == ('.ds-logs-app-2024.01.01-000001',)
+
+def test_record_from_response_without_details():
+    snapshot = SnapshotRecord.from_response({'snapshot': 'logs-app-2024.01.01'})
+    assert snapshot.start_time == 0
+    assert snapshot.state == ''
+    assert snapshot.indices == ()
+
+def test_inventory_replace_and_update(tmp_path):
+    inventory = SnapshotInventory(str(tmp_path / 'cache.json'))
+    inventory.replace([record('a', 100), record('b', 200)])
+    assert inventory.high_water_mark == 200
+    inventory.update([record('b', 200), record('c', 300)])
+    assert len(inventory) == 3
+    assert inventory.high_water_mark == 300
+    assert 'c' in inventory
+
+def test_inventory_high_water_mark_in_progress(tmp_path):
+    inventory = SnapshotInventory(str(tmp_path / 'cache.json'))
+    inventory.replace([record('a', 100), record('b', 200, 'IN_PROGRESS'), record('c', 300)])
+    assert inventory.high_water_mark == 200
+
+def test_inventory_high_water_mark_empty(tmp_path):
+    inventory = SnapshotInventory(str(tmp_path / 'cache.json'))
+    inventory.replace([])
+    assert inventory.high_water_mark == 0
+
+def test_inventory_add_and_remove(tmp_path):
+    inventory = SnapshotInventory(str(tmp_path / 'cache.json'))
+    inventory.add(record('a', 100))
+    inventory.remove('a')
+    inventory.remove('missing')
+    assert inventory.names() == []
+
+def test_inventory_save_and_load(tmp_path):
+    path = str(tmp_path / 'cache' / 'cache.json')
+    inventory = SnapshotInventory(path)
+    inventory.replace([record('a', 100), record('b', 200)])
+    inventory.repository_uuid = 'uuid'
+    inventory.generation = 7
+    inventory.refreshed_at = 1234.5
+    inventory.save()
+
+    loaded = SnapshotInventory(path)
+    assert loaded.load() is True
+    assert loaded.repository_uuid == 'uuid'
+    assert loaded.generation == 7
+    assert loaded.high_water_mark == 200
+    assert loaded.refreshed_at == 1234.5
+    assert loaded.names() == ['a', 'b']
+    assert loaded.records['a'].indices == ('.ds-a-000001',)
+
+def test_inventory_load_missing(tmp_path):
+    assert SnapshotInventory(str(tmp_path / 'missing.json')).load() is False
+
+def test_inventory_load_corrupt(tmp_path):
+    path = tmp_path / 'cache.json'
+    path.write_text('{not json')
+    assert SnapshotInventory(str(path)).load() is False
+
+def test_inventory_load_other_version(tmp_path):
+    path = tmp_path / 'cache.json'
+    path.write_text(json.dumps({'version': 0}))
+    assert SnapshotInventory(str(path)).load() is False
+
+def test_inventory_retain(tmp_path):
+    inventory = SnapshotInventory(str(tmp_path / 'cache.json'))
+    inventory.replace([record('a', 100), record('b', 200)])
+    assert inventory.retain({'a', 'c'}) == 1
+    assert inventory.names() == ['a']
+    assert inventory.high_water_mark == 100
@@ -1,7 +1,10 @@
+import os
+import subprocess
 import sys
 from unittest.mock import patch, MagicMock
 
 import pytest
+import main as main_module
 from main import parse_args, process_data_stream, process_data_streams, main
 
 
@@ -10,6 +13,8 @@ def mock_snapshot_operations():
     with patch('main.snapshot_ops') as mock:
         mock.config.max_workers = 4
         mock.config.delete_data_stream_after_snapshot = True
+        mock.config.mount_searchable_snapshot = False
+        mock.can_resume_mount.return_value = False
         mock.snapshot_exists.return_value = (False, None)
         mock.create_snapshot.return_value = True
         yield mock
@@ -24,12 +29,32 @@ def test_parse_args_with_dry_run():
         args = parse_args()
         assert args.dry_run
 
+def test_parse_args_with_check_config():
+    with patch('sys.argv', ['script.py', '--check-config']):
+        args = parse_args()
+        assert args.check_config
+
 def test_process_data_stream_skip(mock_snapshot_operations):
     mock_snapshot_operations.snapshot_exists.return_value = (True, "Snapshot already exists")
     process_data_stream("test-stream")
     mock_snapshot_operations.create_snapshot.assert_not_called()
     mock_snapshot_operations.delete_data_stream.assert_not_called()
 
+def test_process_data_stream_resume_mount(mock_snapshot_operations):
+    mock_snapshot_operations.snapshot_exists.return_value = (True, "snapshot already exists")
+    mock_snapshot_operations.config.mount_searchable_snapshot = True
+    mock_snapshot_operations.can_resume_mount.return_value = True
+    process_data_stream("test-stream")
+    mock_snapshot_operations.can_resume_mount.assert_called_once_with("test-stream")
+    mock_snapshot_operations.create_snapshot.assert_not_called()
+    mock_snapshot_operations.mount_searchable_snapshot.assert_called_once_with("test-stream", False)
+
+def test_process_data_stream_skip_mount_not_resumable(mock_snapshot_operations):
+    mock_snapshot_operations.snapshot_exists.return_value = (True, "snapshot already exists")
+    mock_snapshot_operations.config.mount_searchable_snapshot = True
+    process_data_stream("test-stream")
+    mock_snapshot_operations.mount_searchable_snapshot.assert_not_called()
+
 def test_process_data_stream_success(mock_snapshot_operations):
     mock_snapshot_operations.snapshot_exists.return_value = (False, None)
     mock_snapshot_operations.create_snapshot.return_value = True
@@ -46,6 +71,14 @@ def test_process_data_stream_success_preserve(mock_snapshot_operations):
     mock_snapshot_operations.create_snapshot.assert_called_once_with("test-stream", False)
     mock_snapshot_operations.delete_data_stream.assert_not_called()
 
+def test_process_data_stream_success_mount(mock_snapshot_operations):
+    mock_snapshot_operations.config.mount_searchable_snapshot = True
+    mock_snapshot_operations.config.delete_data_stream_after_snapshot = False
+    process_data_stream("test-stream")
+    mock_snapshot_operations.create_snapshot.assert_called_once_with("test-stream", False)
+    mock_snapshot_operations.mount_searchable_snapshot.assert_called_once_with("test-stream", False)
+    mock_snapshot_operations.delete_data_stream.assert_not_called()
+
 def test_process_data_stream_failure(mock_snapshot_operations):
     mock_snapshot_operations.snapshot_exists.return_value = (False, None)
     mock_snapshot_operations.create_snapshot.return_value = False
@@ -89,3 +122,44 @@ def test_main_with_error(mock_snapshot_operations):
         with pytest.raises(Exception) as exc_info:
             main()
         assert str(exc_info.value) == "Test error"
+
+
+def test_main_check_config():
+    with patch('sys.argv', ['script.py', '--check-config']), \
+         patch('config.Config') as mock_config, \
+         patch('main.snapshot_ops', None), \
+         patch('snapshot_operations.SnapshotOperations') as mock_snapshot_ops_class:
+        main()
+        mock_config.assert_called_once()
+        mock_snapshot_ops_class.assert_not_called()
+
+def test_main_check_config_invalid():
+    with patch('sys.argv', ['script.py', '--check-config']), \
+         patch('config.Config', side_effect=ValueError("Missing required environment variables")), \
+         patch('main.logger') as mock_logger:
+        with pytest.raises(SystemExit) as exc_info:
+            main()
+        assert exc_info.value.code == 1
+        mock_logger.error.assert_not_called()
+
+def test_main_creates_snapshot_operations():
+    with patch('sys.argv', ['script.py']), \
+         patch('main.snapshot_ops', None), \
+         patch('snapshot_operations.SnapshotOperations') as mock_snapshot_ops_class:
+        mock_snapshot_ops_class.return_value.get_data_streams_older_than_days.return_value = []
+        main()
+        mock_snapshot_ops_class.assert_called_once()
+
+def test_import_main_is_lazy():
+    code = (
+        "import sys, main; "
+        "heavy = [m for m in ('elasticsearch', 'elastic_transport', 'urllib3', 'ecs_logging', 'config') if m in sys.modules]; "
+        "assert main.snapshot_ops is None and not heavy, heavy"
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        cwd=os.path.dirname(os.path.abspath(main_module.__file__)),
+        capture_output=True,
+        text=True
+    )
+    assert result.returncode == 0, result.stderr
@@ -0,0 +1,97 @@
+from datetime import datetime
+
+import pytest
+from retention import RetentionEngine, RetentionPolicy, parse_retention_overrides
+
+NOW = datetime(2024, 6, 15, 12, 0)
+
+
+def daily_snapshots(series, days):
+    return [
+        f"{series}-{datetime.fromordinal(NOW.toordinal() - day).strftime('%Y.%m.%d')}"
+        for day in range(days)
+    ]
+
+def test_evaluate_daily_only():
+    engine = RetentionEngine(RetentionPolicy(daily=7))
+    result = engine.evaluate(daily_snapshots('logs-app', 30), now=NOW)
+    assert len(result.keep) == 7
+    assert len(result.delete) == 23
+    assert all(name.startswith('logs-app-') for name in result.delete)
+
+def test_evaluate_weekly_keeps_newest_per_week():
+    engine = RetentionEngine(RetentionPolicy(daily=0, weekly=4))
+    result = engine.evaluate(daily_snapshots('logs-app', 60), now=NOW)
+    weeks = {datetime.strptime(name[-10:], '%Y.%m.%d').isocalendar()[:2] for name in result.keep}
+    assert len(result.keep) == len(weeks)
+    assert 'logs-app-2024.06.15' in result.keep
+    assert 'logs-app-2024.06.09' in result.keep
+    assert 'logs-app-2024.06.08' not in result.keep
+
+def test_evaluate_weekly_keeps_exactly_n_weeks():
+    engine = RetentionEngine(RetentionPolicy(daily=0, weekly=4))
+    result = engine.evaluate(daily_snapshots('logs-app', 60), now=NOW)
+    assert len(result.keep) == 4
+    assert sorted(result.keep) == [
+        'logs-app-2024.05.26', 'logs-app-2024.06.02', 'logs-app-2024.06.09', 'logs-app-2024.06.15'
+    ]
+
+def test_evaluate_monthly_keeps_newest_per_month():
+    engine = RetentionEngine(RetentionPolicy(daily=0, monthly=3))
+    result = engine.evaluate(daily_snapshots('logs-app', 200), now=NOW)
+    assert sorted(result.keep) == ['logs-app-2024.04.30', 'logs-app-2024.05.31', 'logs-app-2024.06.15']
+
+def test_evaluate_min_count():
+    engine = RetentionEngine(RetentionPolicy(daily=0, min_count=2))
+    result = engine.evaluate(['logs-app-2020.01.01', 'logs-app-2020.01.03', 'logs-app-2020.01.02'], now=NOW)
+    assert sorted(result.keep) == ['logs-app-2020.01.02', 'logs-app-2020.01.03']
+    assert result.delete == ['logs-app-2020.01.01']
+
+def test_evaluate_overrides_per_series():
+    engine = RetentionEngine(RetentionPolicy(daily=1), [('logs-audit*', {'daily': 10}), ('logs-*', {'daily': 5})])
+    result = engine.evaluate(daily_snapshots('logs-audit', 20) + daily_snapshots('metrics-app', 20), now=NOW)
+    assert sum(name.startswith('logs-audit-') for name in result.delete) == 10
+    assert sum(name.startswith('metrics-app-') for name in result.delete) == 19
+    assert len(result.delete) == 29
+
+def test_evaluate_skips_invalid_names():
+    engine = RetentionEngine(RetentionPolicy(daily=0))
+    result = engine.evaluate(['invalid', 'logs-app-invalid-date', 'logs-app-2020.01.01'], now=NOW)
+    assert result.skipped == ['invalid', 'logs-app-invalid-date']
+    assert result.delete == ['logs-app-2020.01.01']
+
+def test_evaluate_default_now():
+    engine = RetentionEngine(RetentionPolicy(daily=30))
+    result = engine.evaluate(['logs-app-2000.01.01', f"logs-app-{datetime.now().strftime('%Y.%m.%d')}"])
+    assert result.delete == ['logs-app-2000.01.01']
+
+def test_parse_retention_overrides():
+    overrides = parse_retention_overrides(' logs-audit-*:daily=90,monthly=24 ; metrics-*:min_count=3;')
+    assert overrides == [('logs-audit-*', {'daily': 90, 'monthly': 24}), ('metrics-*', {'min_count': 3})]
+
+def test_parse_retention_overrides_empty():
+    assert parse_retention_overrides('') == []
+    assert parse_retention_overrides(None) == []
+
+@pytest.mark.parametrize('value', ['logs-*', ':daily=1', 'logs-*:daily', 'logs-*:yearly=1', 'logs-*:daily=x'])
+def test_parse_retention_overrides_invalid(value):
+    with pytest.raises(ValueError):
+        parse_retention_overrides(value)
+
+def test_evaluate_failed_snapshots_do_not_take_slots():
+    engine = RetentionEngine(RetentionPolicy(daily=0, weekly=1, min_count=1))
+    names = ['logs-app-2024.06.14', 'logs-app-2024.06.13']
+    result = engine.evaluate(names, now=NOW, states={'logs-app-2024.06.14': 'FAILED'})
+    assert result.keep == ['logs-app-2024.06.13']
+    assert result.delete == ['logs-app-2024.06.14']
+
+def test_evaluate_unsuccessful_snapshots():
+    engine = RetentionEngine(RetentionPolicy(daily=7))
+    states = {
+        'logs-app-2024.06.14': 'PARTIAL',
+        'logs-app-2024.01.02': 'IN_PROGRESS',
+        'logs-app-2024.01.01': 'FAILED'
+    }
+    result = engine.evaluate(list(states), now=NOW, states=states)
+    assert sorted(result.keep) == ['logs-app-2024.01.02', 'logs-app-2024.06.14']
+    assert result.delete == ['logs-app-2024.01.01']
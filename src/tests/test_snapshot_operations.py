@@ -1,3 +1,4 @@
+import time
 from unittest.mock import patch
 
 import pytest
@@ -17,10 +18,23 @@ def mock_snapshot_operations():
         mock_config.return_value.min_days_to_snapshot = 30
         mock_config.return_value.min_days_to_delete_snapshot = 90
         mock_config.return_value.delete_old_snapshots = True
+        mock_config.return_value.retention_keep_weekly = 0
+        mock_config.return_value.retention_keep_monthly = 0
+        mock_config.return_value.retention_min_count = 0
+        mock_config.return_value.retention_overrides = []
+        mock_config.return_value.repository_cleanup = False
+        mock_config.return_value.repository_cleanup_min_deleted = 1
+        mock_config.return_value.repository_check = "none"
+        mock_config.return_value.inventory_cache = False
+        mock_config.return_value.inventory_cache_max_age_hours = 168
         mock_config.return_value.max_workers = 4
+        mock_config.return_value.searchable_snapshot_storage = "shared_cache"
+        mock_config.return_value.max_concurrent_mounts = 2
         mock_client = mock_es.return_value
         mock_client.indices.get_data_stream.return_value = {'data_streams': []}
         mock_client.snapshot.get.return_value = {'snapshots': []}
+        mock_client.indices.get_settings.return_value = {}
+        mock_client.count.return_value = {'count': 10}
         
         yield SnapshotOperations(mock_config.return_value)
 
@@ -99,11 +113,160 @@ def test_delete_data_stream_error(mock_snapshot_operations):
     result = mock_snapshot_operations.delete_data_stream("test-stream")
     assert result is False
 
+def test_mount_searchable_snapshot_success(mock_snapshot_operations):
+    client = mock_snapshot_operations.client
+    client.indices.get_data_stream.return_value = {
+        'data_streams': [{'indices': [
+            {'index_name': '.ds-test-stream-000001'},
+            {'index_name': '.ds-test-stream-000002'}
+        ]}]
+    }
+    client.options.return_value.cluster.health.return_value = {'timed_out': False}
+    result = mock_snapshot_operations.mount_searchable_snapshot("test-stream")
+    assert result is True
+    assert client.searchable_snapshots.mount.call_count == 2
+    client.searchable_snapshots.mount.assert_any_call(
+        repository="repo",
+        snapshot="test-stream",
+        index='.ds-test-stream-000001',
+        renamed_index='partial-.ds-test-stream-000001',
+        storage="shared_cache",
+        wait_for_completion=False
+    )
+    client.options.return_value.cluster.health.assert_called_once()
+    _, kwargs = client.options.call_args
+    assert kwargs['request_timeout'] > 1800
+    client.indices.delete_data_stream.assert_called_once_with(name="test-stream")
+    client.indices.update_aliases.assert_called_once_with(actions=[{'add': {
+        'indices': ['partial-.ds-test-stream-000001', 'partial-.ds-test-stream-000002'],
+        'alias': "test-stream"
+    }}])
+
+def test_mount_searchable_snapshot_resumes(mock_snapshot_operations):
+    client = mock_snapshot_operations.client
+    client.indices.get_data_stream.return_value = {
+        'data_streams': [{'indices': [
+            {'index_name': '.ds-test-stream-000001'},
+            {'index_name': '.ds-test-stream-000002'}
+        ]}]
+    }
+    client.indices.get_settings.return_value = {'partial-.ds-test-stream-000001': {}}
+    client.options.return_value.cluster.health.return_value = {'timed_out': False}
+    result = mock_snapshot_operations.mount_searchable_snapshot("test-stream")
+    assert result is True
+    client.searchable_snapshots.mount.assert_called_once()
+    _, kwargs = client.searchable_snapshots.mount.call_args
+    assert kwargs['index'] == '.ds-test-stream-000002'
+    client.indices.delete_data_stream.assert_called_once_with(name="test-stream")
+    client.indices.update_aliases.assert_called_once()
+
+def test_mount_searchable_snapshot_document_count_mismatch(mock_snapshot_operations):
+    client = mock_snapshot_operations.client
+    client.indices.get_data_stream.return_value = {
+        'data_streams': [{'indices': [{'index_name': '.ds-test-stream-000001'}]}]
+    }
+    client.options.return_value.cluster.health.return_value = {'timed_out': False}
+    client.count.side_effect = [{'count': 12}, {'count': 10}]
+    result = mock_snapshot_operations.mount_searchable_snapshot("test-stream")
+    assert result is False
+    client.count.assert_any_call(index=['.ds-test-stream-000001'])
+    client.count.assert_any_call(index=['partial-.ds-test-stream-000001'])
+    client.indices.delete_data_stream.assert_not_called()
+
+def test_can_resume_mount(mock_snapshot_operations):
+    client = mock_snapshot_operations.client
+    client.snapshot.get.return_value = {'snapshots': [{'snapshot': 'test-stream', 'state': 'SUCCESS'}]}
+    client.indices.get_data_stream.return_value = {
+        'data_streams': [{'indices': [{'index_name': '.ds-test-stream-000001'}]}]
+    }
+    client.indices.get_settings.return_value = {'partial-.ds-test-stream-000001': {}}
+    assert mock_snapshot_operations.can_resume_mount("test-stream") is True
+
+def test_can_resume_mount_nothing_mounted(mock_snapshot_operations):
+    client = mock_snapshot_operations.client
+    client.snapshot.get.return_value = {'snapshots': [{'snapshot': 'test-stream', 'state': 'SUCCESS'}]}
+    client.indices.get_data_stream.return_value = {
+        'data_streams': [{'indices': [{'index_name': '.ds-test-stream-000001'}]}]
+    }
+    assert mock_snapshot_operations.can_resume_mount("test-stream") is False
+
+def test_can_resume_mount_unsuccessful_snapshot(mock_snapshot_operations):
+    client = mock_snapshot_operations.client
+    client.snapshot.get.return_value = {'snapshots': [{'snapshot': 'test-stream', 'state': 'PARTIAL'}]}
+    assert mock_snapshot_operations.can_resume_mount("test-stream") is False
+    client.indices.get_data_stream.assert_not_called()
+
+def test_can_resume_mount_error(mock_snapshot_operations):
+    mock_snapshot_operations.client.snapshot.get.side_effect = Exception("Test error")
+    assert mock_snapshot_operations.can_resume_mount("test-stream") is False
+
+def test_mount_searchable_snapshot_full_copy(mock_snapshot_operations):
+    mock_snapshot_operations.config.searchable_snapshot_storage = "full_copy"
+    client = mock_snapshot_operations.client
+    client.indices.get_data_stream.return_value = {
+        'data_streams': [{'indices': [{'index_name': '.ds-test-stream-000001'}]}]
+    }
+    client.options.return_value.cluster.health.return_value = {'timed_out': False}
+    result = mock_snapshot_operations.mount_searchable_snapshot("test-stream")
+    assert result is True
+    _, kwargs = client.searchable_snapshots.mount.call_args
+    assert kwargs['renamed_index'] == 'restored-.ds-test-stream-000001'
+    assert kwargs['storage'] == "full_copy"
+
+def test_mount_searchable_snapshot_dry_run(mock_snapshot_operations):
+    result = mock_snapshot_operations.mount_searchable_snapshot("test-stream", dry_run=True)
+    assert result is True
+    mock_snapshot_operations.client.searchable_snapshots.mount.assert_not_called()
+    mock_snapshot_operations.client.indices.delete_data_stream.assert_not_called()
+
+def test_mount_searchable_snapshot_timeout(mock_snapshot_operations):
+    client = mock_snapshot_operations.client
+    client.indices.get_data_stream.return_value = {
+        'data_streams': [{'indices': [{'index_name': '.ds-test-stream-000001'}]}]
+    }
+    client.options.return_value.cluster.health.return_value = {'timed_out': True, 'status': 'yellow'}
+    result = mock_snapshot_operations.mount_searchable_snapshot("test-stream")
+    assert result is False
+    _, kwargs = client.options.call_args
+    assert kwargs['ignore_status'] == 408
+    client.indices.delete_data_stream.assert_not_called()
+
+def test_mount_searchable_snapshot_error(mock_snapshot_operations):
+    client = mock_snapshot_operations.client
+    client.indices.get_data_stream.return_value = {
+        'data_streams': [{'indices': [{'index_name': '.ds-test-stream-000001'}]}]
+    }
+    client.searchable_snapshots.mount.side_effect = Exception("Test error")
+    result = mock_snapshot_operations.mount_searchable_snapshot("test-stream")
+    assert result is False
+    client.indices.delete_data_stream.assert_not_called()
+
+def test_mount_searchable_snapshot_delete_error(mock_snapshot_operations):
+    client = mock_snapshot_operations.client
+    client.indices.get_data_stream.return_value = {
+        'data_streams': [{'indices': [{'index_name': '.ds-test-stream-000001'}]}]
+    }
+    client.options.return_value.cluster.health.return_value = {'timed_out': False}
+    client.indices.delete_data_stream.side_effect = Exception("Test error")
+    result = mock_snapshot_operations.mount_searchable_snapshot("test-stream")
+    assert result is False
+    client.indices.update_aliases.assert_not_called()
+
+def test_mount_searchable_snapshot_alias_error(mock_snapshot_operations):
+    client = mock_snapshot_operations.client
+    client.indices.get_data_stream.return_value = {
+        'data_streams': [{'indices': [{'index_name': '.ds-test-stream-000001'}]}]
+    }
+    client.options.return_value.cluster.health.return_value = {'timed_out': False}
+    client.indices.update_aliases.side_effect = Exception("Test error")
+    result = mock_snapshot_operations.mount_searchable_snapshot("test-stream")
+    assert result is False
+
 def test_delete_old_snapshots_success(mock_snapshot_operations):
     mock_snapshot_operations.client.snapshot.get.return_value = {
         'snapshots': [
-            {'snapshot': 'snapshot-2023.01.01'},
-            {'snapshot': 'snapshot-2023.01.02'}
+            {'snapshot': 'snapshot-2023.01.01', 'state': 'SUCCESS'},
+            {'snapshot': 'snapshot-2023.01.02', 'state': 'SUCCESS'}
         ]
     }
     result = mock_snapshot_operations.delete_old_snapshots()
@@ -113,14 +276,32 @@ def test_delete_old_snapshots_success(mock_snapshot_operations):
 def test_delete_old_snapshots_dry_run(mock_snapshot_operations):
     mock_snapshot_operations.client.snapshot.get.return_value = {
         'snapshots': [
-            {'snapshot': 'snapshot-2023.01.01'},
-            {'snapshot': 'snapshot-2023.01.02'}
+            {'snapshot': 'snapshot-2023.01.01', 'state': 'SUCCESS'},
+            {'snapshot': 'snapshot-2023.01.02', 'state': 'SUCCESS'}
         ]
     }
     result = mock_snapshot_operations.delete_old_snapshots(dry_run=True)
     assert result is True
     mock_snapshot_operations.client.snapshot.delete.assert_not_called()
 
+def test_delete_old_snapshots_with_retention_policy(mock_snapshot_operations):
+    mock_snapshot_operations.config.retention_min_count = 1
+    mock_snapshot_operations.config.retention_overrides = [('keep-*', {'min_count': 5})]
+    mock_snapshot_operations.client.snapshot.get.return_value = {
+        'snapshots': [
+            {'snapshot': 'snapshot-2023.01.01', 'state': 'SUCCESS'},
+            {'snapshot': 'snapshot-2023.01.02', 'state': 'SUCCESS'},
+            {'snapshot': 'keep-app-2023.01.01', 'state': 'SUCCESS'},
+            {'snapshot': 'keep-app-2023.01.02', 'state': 'SUCCESS'}
+        ]
+    }
+    result = mock_snapshot_operations.delete_old_snapshots()
+    assert result is True
+    mock_snapshot_operations.client.snapshot.delete.assert_called_once_with(
+        repository="repo",
+        snapshot='snapshot-2023.01.01'
+    )
+
 def test_delete_old_snapshots_error(mock_snapshot_operations):
     mock_snapshot_operations.client.snapshot.get.side_effect = Exception("Test error")
     result = mock_snapshot_operations.delete_old_snapshots()
@@ -129,8 +310,8 @@ def test_delete_old_snapshots_error(mock_snapshot_operations):
 def test_delete_old_snapshots_with_invalid_date(mock_snapshot_operations):
     mock_snapshot_operations.client.snapshot.get.return_value = {
         'snapshots': [
-            {'snapshot': 'snapshot-invalid-date'},
-            {'snapshot': 'snapshot-2023.01.01'}
+            {'snapshot': 'snapshot-invalid-date', 'state': 'SUCCESS'},
+            {'snapshot': 'snapshot-2023.01.01', 'state': 'SUCCESS'}
         ]
     }
     result = mock_snapshot_operations.delete_old_snapshots()
@@ -143,4 +324,267 @@ def test_delete_old_snapshots_no_snapshots(mock_snapshot_operations):
     }
     result = mock_snapshot_operations.delete_old_snapshots()
     assert result is True
-    mock_snapshot_operations.client.snapshot.delete.assert_not_called() 
\ No newline at end of file
+    mock_snapshot_operations.client.snapshot.delete.assert_not_called() 
+
+def test_delete_old_snapshots_with_repository_cleanup(mock_snapshot_operations):
+    mock_snapshot_operations.config.repository_cleanup = True
+    mock_snapshot_operations.config.repository_cleanup_min_deleted = 2
+    mock_snapshot_operations.client.snapshot.get.return_value = {
+        'snapshots': [
+            {'snapshot': 'snapshot-2023.01.01', 'state': 'SUCCESS'},
+            {'snapshot': 'snapshot-2023.01.02', 'state': 'SUCCESS'}
+        ]
+    }
+    mock_snapshot_operations.client.options.return_value.snapshot.cleanup_repository.return_value = {
+        'results': {'deleted_bytes': 20, 'deleted_blobs': 5}
+    }
+    result = mock_snapshot_operations.delete_old_snapshots()
+    assert result is True
+    mock_snapshot_operations.client.options.return_value.snapshot.cleanup_repository.assert_called_once_with(name="repo")
+
+def test_delete_old_snapshots_below_cleanup_threshold(mock_snapshot_operations):
+    mock_snapshot_operations.config.repository_cleanup = True
+    mock_snapshot_operations.config.repository_cleanup_min_deleted = 3
+    mock_snapshot_operations.client.snapshot.get.return_value = {
+        'snapshots': [
+            {'snapshot': 'snapshot-2023.01.01', 'state': 'SUCCESS'},
+            {'snapshot': 'snapshot-2023.01.02', 'state': 'SUCCESS'}
+        ]
+    }
+    result = mock_snapshot_operations.delete_old_snapshots()
+    assert result is True
+    mock_snapshot_operations.client.options.return_value.snapshot.cleanup_repository.assert_not_called()
+
+def test_maintain_repository_dry_run(mock_snapshot_operations):
+    result = mock_snapshot_operations.maintain_repository(dry_run=True)
+    assert result is True
+    mock_snapshot_operations.client.options.return_value.snapshot.cleanup_repository.assert_not_called()
+
+def test_maintain_repository_verify(mock_snapshot_operations):
+    mock_snapshot_operations.config.repository_check = "verify"
+    mock_snapshot_operations.client.options.return_value.snapshot.cleanup_repository.return_value = {
+        'results': {'deleted_bytes': 20, 'deleted_blobs': 5}
+    }
+    result = mock_snapshot_operations.maintain_repository()
+    assert result is True
+    mock_snapshot_operations.client.options.return_value.snapshot.verify_repository.assert_called_once_with(name="repo")
+    mock_snapshot_operations.client.options.return_value.snapshot.repository_analyze.assert_not_called()
+
+def test_maintain_repository_analyze(mock_snapshot_operations):
+    mock_snapshot_operations.config.repository_check = "analyze"
+    mock_snapshot_operations.client.options.return_value.snapshot.cleanup_repository.return_value = {
+        'results': {'deleted_bytes': 20, 'deleted_blobs': 5}
+    }
+    result = mock_snapshot_operations.maintain_repository()
+    assert result is True
+    _, kwargs = mock_snapshot_operations.client.options.return_value.snapshot.repository_analyze.call_args
+    assert kwargs['timeout'] == '600s'
+    _, kwargs = mock_snapshot_operations.client.options.call_args
+    assert kwargs['request_timeout'] > 600
+    mock_snapshot_operations.client.options.return_value.snapshot.verify_repository.assert_not_called()
+
+def test_maintain_repository_error(mock_snapshot_operations):
+    mock_snapshot_operations.client.options.return_value.snapshot.cleanup_repository.side_effect = Exception("Test error")
+    result = mock_snapshot_operations.maintain_repository()
+    assert result is False
+
+
+@pytest.fixture
+def cached_snapshot_operations(mock_snapshot_operations, tmp_path):
+    mock_snapshot_operations.config.inventory_cache = True
+    mock_snapshot_operations.config.inventory_cache_dir = str(tmp_path)
+    mock_snapshot_operations.client.cluster.state.return_value = {
+        'metadata': {'repositories': {'repo': {'uuid': 'uuid', 'generation': 10}}}
+    }
+    mock_snapshot_operations.client.snapshot.get.return_value = {
+        'snapshots': [
+            {'snapshot': 'stream-2023.01.01', 'start_time_in_millis': 100, 'state': 'SUCCESS', 'indices': []},
+            {'snapshot': 'stream-2023.01.02', 'start_time_in_millis': 200, 'state': 'SUCCESS', 'indices': []}
+        ]
+    }
+    yield mock_snapshot_operations
+
+def save_cached_inventory(snapshot_ops, generation, refreshed_at=None):
+    snapshot_ops.get_inventory()
+    snapshot_ops.inventory.generation = generation
+    if refreshed_at is not None:
+        snapshot_ops.inventory.refreshed_at = refreshed_at
+    snapshot_ops.save_inventory()
+    snapshot_ops.inventory = None
+    snapshot_ops.client.snapshot.get.reset_mock()
+
+def test_snapshot_exists_with_inventory_cache(cached_snapshot_operations):
+    assert cached_snapshot_operations.snapshot_exists("stream-2023.01.01") == (True, "snapshot already exists")
+    assert cached_snapshot_operations.snapshot_exists("stream-2023.01.03") == (False, "")
+    cached_snapshot_operations.client.snapshot.get.assert_called_once_with(repository="repo", snapshot="pattern")
+
+def test_snapshot_exists_with_inventory_cache_error(cached_snapshot_operations):
+    cached_snapshot_operations.client.cluster.state.side_effect = Exception("Test error")
+    should_skip, reason = cached_snapshot_operations.snapshot_exists("stream-2023.01.01")
+    assert should_skip is True
+    assert reason == "could not verify snapshot existence"
+
+def test_inventory_cache_warm(cached_snapshot_operations):
+    save_cached_inventory(cached_snapshot_operations, generation=10)
+    inventory = cached_snapshot_operations.get_inventory()
+    assert len(inventory) == 2
+    cached_snapshot_operations.client.snapshot.get.assert_not_called()
+
+def snapshot_names(*names):
+    return {'snapshots': [{'snapshot': name} for name in names]}
+
+def test_inventory_cache_incremental(cached_snapshot_operations):
+    save_cached_inventory(cached_snapshot_operations, generation=9)
+    cached_snapshot_operations.client.snapshot.get.side_effect = [
+        snapshot_names('stream-2023.01.01', 'stream-2023.01.02', 'stream-2023.01.03'),
+        {'snapshots': [{'snapshot': 'stream-2023.01.03', 'start_time_in_millis': 300, 'state': 'SUCCESS', 'indices': []}]}
+    ]
+    inventory = cached_snapshot_operations.get_inventory()
+    assert len(inventory) == 3
+    assert inventory.generation == 10
+    cached_snapshot_operations.client.snapshot.get.assert_any_call(
+        repository="repo",
+        snapshot="pattern",
+        verbose=False
+    )
+    cached_snapshot_operations.client.snapshot.get.assert_called_with(
+        repository="repo",
+        snapshot="pattern",
+        sort='start_time',
+        from_sort_value='200'
+    )
+
+def test_inventory_cache_external_deletion(cached_snapshot_operations):
+    cached_snapshot_operations.config.retention_min_count = 1
+    save_cached_inventory(cached_snapshot_operations, generation=9)
+    cached_snapshot_operations.client.snapshot.get.side_effect = [
+        snapshot_names('stream-2023.01.01'),
+        {'snapshots': []}
+    ]
+    assert cached_snapshot_operations.snapshot_exists("stream-2023.01.02") == (False, "")
+    assert cached_snapshot_operations.inventory.names() == ['stream-2023.01.01']
+    assert cached_snapshot_operations.delete_old_snapshots() is True
+    cached_snapshot_operations.client.snapshot.delete.assert_not_called()
+
+def test_inventory_cache_missing_snapshots(cached_snapshot_operations):
+    save_cached_inventory(cached_snapshot_operations, generation=9)
+    full = {'snapshots': [
+        {'snapshot': 'stream-2023.01.01', 'start_time_in_millis': 100, 'state': 'SUCCESS', 'indices': []},
+        {'snapshot': 'stream-2022.12.31', 'start_time_in_millis': 50, 'state': 'SUCCESS', 'indices': []}
+    ]}
+    cached_snapshot_operations.client.snapshot.get.side_effect = [
+        snapshot_names('stream-2023.01.01', 'stream-2022.12.31'),
+        {'snapshots': []},
+        full
+    ]
+    inventory = cached_snapshot_operations.get_inventory()
+    assert sorted(inventory.names()) == ['stream-2022.12.31', 'stream-2023.01.01']
+    cached_snapshot_operations.client.snapshot.get.assert_called_with(repository="repo", snapshot="pattern")
+
+def test_inventory_cache_expired(cached_snapshot_operations):
+    save_cached_inventory(cached_snapshot_operations, generation=10, refreshed_at=time.time() - 169 * 3600)
+    cached_snapshot_operations.get_inventory()
+    cached_snapshot_operations.client.snapshot.get.assert_called_once_with(repository="repo", snapshot="pattern")
+
+def test_save_inventory_without_cache(mock_snapshot_operations):
+    assert mock_snapshot_operations.save_inventory() is True
+
+def test_save_inventory_error(cached_snapshot_operations, tmp_path):
+    cached_snapshot_operations.get_inventory()
+    cached_snapshot_operations.inventory.path = str(tmp_path)
+    assert cached_snapshot_operations.save_inventory() is False
+
+def test_create_snapshot_updates_inventory(cached_snapshot_operations):
+    cached_snapshot_operations.get_inventory()
+    cached_snapshot_operations.client.snapshot.create.return_value = {
+        'snapshot': {'snapshot': 'stream-2023.01.03', 'start_time_in_millis': 300, 'state': 'SUCCESS', 'indices': []}
+    }
+    assert cached_snapshot_operations.create_snapshot("stream-2023.01.03") is True
+    assert "stream-2023.01.03" in cached_snapshot_operations.inventory
+
+def test_delete_old_snapshots_with_inventory_cache(cached_snapshot_operations):
+    cached_snapshot_operations.client.snapshot.delete.side_effect = [None, NotFoundError('msg', {}, {})]
+    result = cached_snapshot_operations.delete_old_snapshots()
+    assert result is True
+    assert cached_snapshot_operations.client.snapshot.delete.call_count == 2
+    assert len(cached_snapshot_operations.inventory) == 0
+
+def test_delete_old_snapshots_keeps_mounted_snapshots(mock_snapshot_operations):
+    mock_snapshot_operations.client.snapshot.get.return_value = {
+        'snapshots': [
+            {'snapshot': 'snapshot-2023.01.01', 'state': 'SUCCESS'},
+            {'snapshot': 'snapshot-2023.01.02', 'state': 'SUCCESS'}
+        ]
+    }
+    mock_snapshot_operations.client.indices.get_settings.return_value = {
+        'partial-.ds-snapshot-2023.01.01-000001': {'settings': {
+            'index.store.snapshot.repository_name': 'repo',
+            'index.store.snapshot.snapshot_name': 'snapshot-2023.01.01'
+        }},
+        'partial-.ds-snapshot-2023.01.02-000001': {'settings': {
+            'index.store.snapshot.repository_name': 'other-repo',
+            'index.store.snapshot.snapshot_name': 'snapshot-2023.01.02'
+        }}
+    }
+    result = mock_snapshot_operations.delete_old_snapshots()
+    assert result is True
+    mock_snapshot_operations.client.snapshot.delete.assert_called_once_with(
+        repository="repo",
+        snapshot='snapshot-2023.01.02'
+    )
+
+def test_delete_old_snapshots_mounted_snapshots_error(mock_snapshot_operations):
+    mock_snapshot_operations.client.snapshot.get.return_value = {
+        'snapshots': [{'snapshot': 'snapshot-2023.01.01', 'state': 'SUCCESS'}]
+    }
+    mock_snapshot_operations.client.indices.get_settings.side_effect = Exception("Test error")
+    result = mock_snapshot_operations.delete_old_snapshots()
+    assert result is True
+    mock_snapshot_operations.client.snapshot.delete.assert_called_once()
+
+def test_delete_old_snapshots_continues_after_error(mock_snapshot_operations):
+    mock_snapshot_operations.client.snapshot.get.return_value = {
+        'snapshots': [
+            {'snapshot': 'snapshot-2023.01.01', 'state': 'SUCCESS'},
+            {'snapshot': 'snapshot-2023.01.02', 'state': 'SUCCESS'}
+        ]
+    }
+    mock_snapshot_operations.client.snapshot.delete.side_effect = [Exception("Test error"), None]
+    result = mock_snapshot_operations.delete_old_snapshots()
+    assert result is True
+    assert mock_snapshot_operations.client.snapshot.delete.call_count == 2
+
+def test_delete_old_snapshots_failed_snapshot_does_not_count(mock_snapshot_operations):
+    mock_snapshot_operations.config.retention_min_count = 1
+    mock_snapshot_operations.client.snapshot.get.return_value = {
+        'snapshots': [
+            {'snapshot': 'snapshot-2023.01.01', 'state': 'SUCCESS'},
+            {'snapshot': 'snapshot-2023.01.02', 'state': 'FAILED'}
+        ]
+    }
+    result = mock_snapshot_operations.delete_old_snapshots()
+    assert result is True
+    mock_snapshot_operations.client.snapshot.get.assert_called_once_with(
+        repository="repo",
+        snapshot="pattern",
+        verbose=False
+    )
+    mock_snapshot_operations.client.snapshot.delete.assert_called_once_with(
+        repository="repo",
+        snapshot='snapshot-2023.01.02'
+    )
+
+def test_delete_old_snapshots_report_counts_actual_deletions(mock_snapshot_operations):
+    mock_snapshot_operations.client.snapshot.get.return_value = {
+        'snapshots': [
+            {'snapshot': 'snapshot-2023.01.01', 'state': 'SUCCESS'},
+            {'snapshot': 'snapshot-2023.01.02', 'state': 'SUCCESS'}
+        ]
+    }
+    mock_snapshot_operations.client.snapshot.delete.side_effect = [NotFoundError('msg', {}, {}), None]
+    with patch('snapshot_operations.logger') as mock_logger:
+        result = mock_snapshot_operations.delete_old_snapshots()
+    assert result is True
+    messages = [call.args[0] for call in mock_logger.info.call_args_list]
+    assert "Retention report: snapshot - 1 reclaimed" in messages
+    assert "Retention report: 0 kept, 1 reclaimed, 0 skipped" in messages